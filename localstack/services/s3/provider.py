@@ -107,7 +107,8 @@ from localstack.services.s3.presigned_url import (
     validate_post_policy,
 )
 from localstack.services.s3.utils import (
-    ALLOWED_HEADER_OVERRIDES,
+    ALLOWED_HEADER_OVERRIDES_ITEMS,
+    CHECKSUM_ALGORITHM_KEYS,
     VALID_ACL_PREDEFINED_GROUPS,
     VALID_GRANTEE_PERMISSIONS,
     VALID_STORAGE_CLASSES,
@@ -355,7 +356,7 @@ class S3Provider(S3Api, ServiceLifecycleHook):
         if "VersionId" in response and bucket not in self.get_store().bucket_versioning_status:
             response.pop("VersionId")
 
-        for request_param, response_param in ALLOWED_HEADER_OVERRIDES.items():
+        for request_param, response_param in ALLOWED_HEADER_OVERRIDES_ITEMS:
             if request_param_value := request.get(request_param):  # noqa
                 response[response_param] = request_param_value  # noqa
 
@@ -374,7 +375,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 checksum_algorithm=checksum_algorithm,
                 data=key_object.value,
             )
-            response[f"Checksum{checksum_algorithm.upper()}"] = checksum  # noqa
+            checksum_key, _ = CHECKSUM_ALGORITHM_KEYS[checksum_algorithm]
+            response[checksum_key] = checksum  # noqa
 
         response["AcceptRanges"] = "bytes"
         return response
@@ -1018,7 +1020,8 @@ class S3Provider(S3Api, ServiceLifecycleHook):
                 checksum_algorithm=checksum_algorithm,
                 data=key.value,
             )
-            response["Checksum"] = {f"Checksum{checksum_algorithm.upper()}": checksum}  # noqa
+            checksum_key, _ = CHECKSUM_ALGORITHM_KEYS[checksum_algorithm]
+            response["Checksum"] = {checksum_key: checksum}  # noqa
 
         response["LastModified"] = key.last_modified
         if version_id := request.get("VersionId"):
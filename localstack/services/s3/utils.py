@@ -1,11 +1,14 @@
 import datetime
+import hmac
 import re
-from typing import Dict, Union
+import string
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Union
 
 import moto.s3.models as moto_s3_models
 from botocore.exceptions import ClientError
-from botocore.utils import InvalidArnException
-from moto.s3.exceptions import MissingBucket
+from botocore.httpchecksum import Crc32Checksum, CrtCrc32cChecksum, Sha1Checksum, Sha256Checksum
 from moto.s3.models import FakeBucket, FakeDeleteMarker, FakeKey
 
 from localstack.aws.api import CommonServiceException, ServiceException
@@ -23,14 +26,32 @@ from localstack.aws.api.s3 import (
 )
 from localstack.utils.aws import arns, aws_stack
 from localstack.utils.aws.arns import parse_arn
-from localstack.utils.strings import checksum_crc32, checksum_crc32c, hash_sha1, hash_sha256
+from localstack.utils.strings import (
+    checksum_crc32,
+    checksum_crc32c,
+    hash_sha1,
+    hash_sha256,
+    to_bytes,
+)
+
+# request member holding the checksum, and lowercase name used in the header, per checksum algorithm
+CHECKSUM_ALGORITHM_KEYS = {
+    ChecksumAlgorithm.SHA1: ("ChecksumSHA1", "sha1"),
+    ChecksumAlgorithm.SHA256: ("ChecksumSHA256", "sha256"),
+    ChecksumAlgorithm.CRC32: ("ChecksumCRC32", "crc32"),
+    ChecksumAlgorithm.CRC32C: ("ChecksumCRC32C", "crc32c"),
+}
 
-checksum_keys = ["ChecksumSHA1", "ChecksumSHA256", "ChecksumCRC32", "ChecksumCRC32C"]
+checksum_keys = frozenset(key for key, _ in CHECKSUM_ALGORITHM_KEYS.values())
 
 BUCKET_NAME_REGEX = (
     r"(?=^.{3,63}$)(?!^(\d+\.)+\d+$)"
     + r"(^(([a-z0-9]|[a-z0-9][a-z0-9\-]*[a-z0-9])\.)*([a-z0-9]|[a-z0-9][a-z0-9\-]*[a-z0-9])$)"
 )
+# translation table deleting every character allowed in a bucket name, see `is_bucket_name_valid`
+BUCKET_NAME_ALLOWED_CHARS_TABLE = str.maketrans(
+    "", "", string.ascii_lowercase + string.digits + ".-"
+)
 
 REGION_REGEX = r"[a-z]{2}-[a-z]+-[0-9]{1,}"
 PORT_REGEX = r"(:[\d]{0,6})?"
@@ -43,6 +64,8 @@ S3_VIRTUAL_HOSTNAME_REGEX = (  # path based refs have at least valid bucket expr
 ).format(
     REGION_REGEX, REGION_REGEX, PORT_REGEX
 )
+# only matched against the forwarded `Host` header value, which is ASCII
+S3_VIRTUAL_HOSTNAME_RE = re.compile(S3_VIRTUAL_HOSTNAME_REGEX, re.ASCII)
 
 PATTERN_UUID = re.compile(
     r"[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}"
@@ -50,43 +73,51 @@ PATTERN_UUID = re.compile(
 
 S3_VIRTUAL_HOST_FORWARDED_HEADER = "x-s3-vhost-forwarded-for"
 
-VALID_CANNED_ACLS_BUCKET = {
-    # https://docs.aws.amazon.com/AmazonS3/latest/userguide/acl-overview.html#canned-acl
-    # bucket-owner-read + bucket-owner-full-control are allowed, but ignored for buckets
-    ObjectCannedACL.private,
-    ObjectCannedACL.authenticated_read,
-    ObjectCannedACL.aws_exec_read,
-    ObjectCannedACL.bucket_owner_full_control,
-    ObjectCannedACL.bucket_owner_read,
-    ObjectCannedACL.public_read,
-    ObjectCannedACL.public_read_write,
-    BucketCannedACL.log_delivery_write,
-}
+VALID_CANNED_ACLS_BUCKET = frozenset(
+    {
+        # https://docs.aws.amazon.com/AmazonS3/latest/userguide/acl-overview.html#canned-acl
+        # bucket-owner-read + bucket-owner-full-control are allowed, but ignored for buckets
+        ObjectCannedACL.private,
+        ObjectCannedACL.authenticated_read,
+        ObjectCannedACL.aws_exec_read,
+        ObjectCannedACL.bucket_owner_full_control,
+        ObjectCannedACL.bucket_owner_read,
+        ObjectCannedACL.public_read,
+        ObjectCannedACL.public_read_write,
+        BucketCannedACL.log_delivery_write,
+    }
+)
 
-VALID_ACL_PREDEFINED_GROUPS = {
-    "http://acs.amazonaws.com/groups/global/AuthenticatedUsers",
-    "http://acs.amazonaws.com/groups/global/AllUsers",
-    "http://acs.amazonaws.com/groups/s3/LogDelivery",
-}
+VALID_ACL_PREDEFINED_GROUPS = frozenset(
+    {
+        "http://acs.amazonaws.com/groups/global/AuthenticatedUsers",
+        "http://acs.amazonaws.com/groups/global/AllUsers",
+        "http://acs.amazonaws.com/groups/s3/LogDelivery",
+    }
+)
 
-VALID_GRANTEE_PERMISSIONS = {
-    Permission.FULL_CONTROL,
-    Permission.READ,
-    Permission.READ_ACP,
-    Permission.WRITE,
-    Permission.WRITE_ACP,
-}
+VALID_GRANTEE_PERMISSIONS = frozenset(
+    {
+        Permission.FULL_CONTROL,
+        Permission.READ,
+        Permission.READ_ACP,
+        Permission.WRITE,
+        Permission.WRITE_ACP,
+    }
+)
 
-VALID_STORAGE_CLASSES = [
-    StorageClass.STANDARD,
-    StorageClass.STANDARD_IA,
-    StorageClass.GLACIER,
-    StorageClass.GLACIER_IR,
-    StorageClass.REDUCED_REDUNDANCY,
-    StorageClass.ONEZONE_IA,
-    StorageClass.INTELLIGENT_TIERING,
-    StorageClass.DEEP_ARCHIVE,
-]
+VALID_STORAGE_CLASSES = frozenset(
+    {
+        StorageClass.STANDARD,
+        StorageClass.STANDARD_IA,
+        StorageClass.GLACIER,
+        StorageClass.GLACIER_IR,
+        StorageClass.REDUCED_REDUNDANCY,
+        StorageClass.ONEZONE_IA,
+        StorageClass.INTELLIGENT_TIERING,
+        StorageClass.DEEP_ARCHIVE,
+    }
+)
 
 # response header overrides the client may request
 ALLOWED_HEADER_OVERRIDES = {
@@ -97,6 +128,23 @@ ALLOWED_HEADER_OVERRIDES = {
     "ResponseContentDisposition": "ContentDisposition",
     "ResponseContentEncoding": "ContentEncoding",
 }
+# (request parameter, response member) pairs, iterated for each GetObject
+ALLOWED_HEADER_OVERRIDES_ITEMS = tuple(ALLOWED_HEADER_OVERRIDES.items())
+
+CHECKSUM_FUNCTIONS = {
+    ChecksumAlgorithm.CRC32: checksum_crc32,
+    ChecksumAlgorithm.CRC32C: checksum_crc32c,
+    ChecksumAlgorithm.SHA1: hash_sha1,
+    ChecksumAlgorithm.SHA256: hash_sha256,
+}
+
+# incremental checksums, used when the data is passed as an iterable of chunks
+STREAMING_CHECKSUM_CLASSES = {
+    ChecksumAlgorithm.CRC32: Crc32Checksum,
+    ChecksumAlgorithm.CRC32C: CrtCrc32cChecksum,
+    ChecksumAlgorithm.SHA1: Sha1Checksum,
+    ChecksumAlgorithm.SHA256: Sha256Checksum,
+}
 
 
 class InvalidRequest(ServiceException):
@@ -105,68 +153,137 @@ class InvalidRequest(ServiceException):
     status_code: int = 400
 
 
-def get_object_checksum_for_algorithm(checksum_algorithm: str, data: bytes):
-    match checksum_algorithm:
-        case ChecksumAlgorithm.CRC32:
-            return checksum_crc32(data)
-
-        case ChecksumAlgorithm.CRC32C:
-            return checksum_crc32c(data)
-
-        case ChecksumAlgorithm.SHA1:
-            return hash_sha1(data)
+def get_object_checksum_for_algorithm(
+    checksum_algorithm: str, data: Union[bytes, bytearray, memoryview, Iterable[bytes]]
+) -> str:
+    """
+    Compute the base64 encoded checksum of the data with the given algorithm
+    :param checksum_algorithm: one of ChecksumAlgorithm
+    :param data: the whole data as a bytes-like object, or an iterable of chunks which will be hashed
+        incrementally
+    :raise InvalidRequest: if the algorithm is not supported
+    :return: the base64 encoded checksum
+    """
+    if checksum_algorithm not in CHECKSUM_FUNCTIONS:
+        # TODO: check proper error? for now validated client side, need to check server response
+        raise InvalidRequest("The value specified in the x-amz-trailer header is not supported")
 
-        case ChecksumAlgorithm.SHA256:
-            return hash_sha256(data)
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        return CHECKSUM_FUNCTIONS[checksum_algorithm](data)
 
-        case _:
-            # TODO: check proper error? for now validated client side, need to check server response
-            raise InvalidRequest("The value specified in the x-amz-trailer header is not supported")
+    checksum = STREAMING_CHECKSUM_CLASSES[checksum_algorithm]()
+    for chunk in data:
+        checksum.update(chunk)
+    return checksum.b64digest()
 
 
-def verify_checksum(checksum_algorithm: str, data: bytes, request: Dict):
+def verify_checksum(
+    checksum_algorithm: str,
+    data: Union[bytes, bytearray, memoryview, Iterable[bytes]],
+    request: Dict,
+):
     # TODO: you don't have to specify the checksum algorithm
     # you can use only the checksum-{algorithm-type} header
     # https://docs.aws.amazon.com/AmazonS3/latest/userguide/checking-object-integrity.html
-    key = f"Checksum{checksum_algorithm.upper()}"
+    # raises if the algorithm is not supported
+    calculated_checksum = get_object_checksum_for_algorithm(checksum_algorithm, data)
+    key, algorithm_name = CHECKSUM_ALGORITHM_KEYS[checksum_algorithm]
     # TODO: is there a message if the header is missing?
     checksum = request.get(key)
-    calculated_checksum = get_object_checksum_for_algorithm(checksum_algorithm, data)
 
-    if calculated_checksum != checksum:
-        raise InvalidRequest(
-            f"Value for x-amz-checksum-{checksum_algorithm.lower()} header is invalid."
-        )
+    # constant time comparison, encode both values as non-ASCII strings are not supported by compare_digest
+    if not checksum or not hmac.compare_digest(to_bytes(calculated_checksum), to_bytes(checksum)):
+        raise InvalidRequest(f"Value for x-amz-checksum-{algorithm_name} header is invalid.")
 
 
-def is_key_expired(key_object: Union[FakeKey, FakeDeleteMarker]) -> bool:
+def is_key_expired(
+    key_object: Union[FakeKey, FakeDeleteMarker], now: Optional[datetime.datetime] = None
+) -> bool:
+    """
+    Check whether the key is expired
+    :param key_object: the key to check
+    :param now: the current time, can be computed once by the caller when checking many keys in a row
+    :return: True if the key has an expiry date in the past
+    """
     if not key_object or isinstance(key_object, FakeDeleteMarker) or not key_object._expiry:
         return False
-    return key_object._expiry <= datetime.datetime.now(key_object._expiry.tzinfo)
+    expiry_timestamp = _get_expiry_timestamp(key_object)
+    now_timestamp = time.time() if now is None else now.timestamp()
+    return expiry_timestamp <= now_timestamp
+
+
+def _get_expiry_timestamp(key_object: FakeKey) -> float:
+    """
+    Returns the expiry of the key as a POSIX timestamp, cached on the key along with the datetime it was computed
+    from, as moto can update `_expiry` directly (ex: `restore`, `copy_object`).
+    Naive expiry dates are in local time, like `datetime.datetime.now()`.
+    """
+    expiry = key_object._expiry
+    cached_expiry = getattr(key_object, "_expiry_timestamp", None)
+    if cached_expiry and cached_expiry[0] is expiry:
+        return cached_expiry[1]
+
+    expiry_timestamp = expiry.timestamp()
+    key_object._expiry_timestamp = (expiry, expiry_timestamp)
+    return expiry_timestamp
 
 
 def is_bucket_name_valid(bucket_name: str) -> bool:
     """
     ref. https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
     """
-    return True if re.match(BUCKET_NAME_REGEX, bucket_name) else False
+    # equivalent of BUCKET_NAME_REGEX, without the backtracking of its lookaheads
+    if not 3 <= len(bucket_name) <= 63:
+        return False
+    # only lowercase letters, digits, dots and hyphens are allowed
+    if bucket_name.translate(BUCKET_NAME_ALLOWED_CHARS_TABLE):
+        return False
+
+    labels = bucket_name.split(".")
+    for label in labels:
+        # labels cannot be empty (adjacent dots), and must begin and end with a letter or a digit
+        if not label or label[0] == "-" or label[-1] == "-":
+            return False
+
+    # the name must not be formatted as an IP address
+    return len(labels) == 1 or not all(label.isdigit() for label in labels)
 
 
 def is_canned_acl_bucket_valid(canned_acl: str) -> bool:
     return canned_acl in VALID_CANNED_ACLS_BUCKET
 
 
+@lru_cache(maxsize=64)
 def get_header_name(capitalized_field: str) -> str:
-    headers_parts = re.split(r"([A-Z][a-z]+)", capitalized_field)
-    return f"x-amz-{'-'.join([part.lower() for part in headers_parts if part])}"
+    # single pass equivalent of splitting around `[A-Z][a-z]+` words: a new part starts at the
+    # beginning of a word, or right after a word ends (ex: GrantReadACP -> grant-read-acp)
+    parts = []
+    start = 0
+    in_word = False
+    for i, char in enumerate(capitalized_field):
+        if "A" <= char <= "Z" and "a" <= capitalized_field[i + 1 : i + 2] <= "z":
+            if i > start:
+                parts.append(capitalized_field[start:i])
+            start = i
+            in_word = True
+        elif in_word and not "a" <= char <= "z":
+            parts.append(capitalized_field[start:i])
+            start = i
+            in_word = False
+    if start < len(capitalized_field):
+        parts.append(capitalized_field[start:])
+    return f"x-amz-{'-'.join(parts).lower()}"
 
 
 def is_valid_canonical_id(canonical_id: str) -> bool:
     """
     Validate that the string is a hex string with 64 char
     """
+    if len(canonical_id) != 64:
+        return False
     try:
-        return int(canonical_id, 16) and len(canonical_id) == 64
+        # fromhex skips whitespaces, a valid ID needs to decode to exactly 32 bytes
+        return len(bytes.fromhex(canonical_id)) == 32
     except ValueError:
         return False
 
@@ -177,7 +294,12 @@ def forwarded_from_virtual_host_addressed_request(headers: Dict[str, str]) -> bo
     """
     # we can assume that the host header we are receiving here is actually the header we originally received
     # from the client (because the edge service is forwarding the request in memory)
-    match = re.match(S3_VIRTUAL_HOSTNAME_REGEX, headers.get(S3_VIRTUAL_HOST_FORWARDED_HEADER, ""))
+    host = headers.get(S3_VIRTUAL_HOST_FORWARDED_HEADER)
+    # every alternative of the v-host regex requires one of those, skip the regex if neither is present
+    if not host or ("localhost" not in host and "amazonaws.com" not in host):
+        return False
+
+    match = S3_VIRTUAL_HOSTNAME_RE.match(host)
 
     # checks whether there is a bucket name. This is sort of hacky
     return True if match and match.group(3) else False
@@ -187,13 +309,15 @@ def get_bucket_from_moto(
     moto_backend: moto_s3_models.S3Backend, bucket: BucketName
 ) -> moto_s3_models.FakeBucket:
     # TODO: check authorization for buckets as well?
-    try:
-        return moto_backend.get_bucket(bucket_name=bucket)
-    except MissingBucket:
+    # access the buckets directly instead of `get_bucket`, to avoid raising and catching `MissingBucket`
+    moto_bucket = moto_backend.buckets.get(bucket)
+    if moto_bucket is None:
         ex = NoSuchBucket("The specified bucket does not exist")
         ex.BucketName = bucket
         raise ex
 
+    return moto_bucket
+
 
 def get_key_from_moto_bucket(
     moto_bucket: moto_s3_models.FakeBucket, key: ObjectKey
@@ -210,15 +334,18 @@ def get_key_from_moto_bucket(
 def _create_invalid_argument_exc(
     message: Union[str, None], name: str, value: str, host_id: str = None
 ) -> InvalidArgument:
-    ex = InvalidArgument(message)
-    ex.ArgumentName = name
-    ex.ArgumentValue = value
+    ex = InvalidArgument(message, ArgumentName=name, ArgumentValue=value)
     if host_id:
         ex.HostId = host_id
     return ex
 
 
+@lru_cache(maxsize=128)
 def capitalize_header_name_from_snake_case(header_name: str) -> str:
+    # `str.title` capitalizes every part in one pass, but also treats digits and other characters as word
+    # boundaries (ex: `x-amz-meta-a1b` -> `X-Amz-Meta-A1B`), only use it if the parts contain letters only
+    if header_name.replace("-", "").isalpha():
+        return header_name.title()
     return "-".join([part.capitalize() for part in header_name.split("-")])
 
 
@@ -230,7 +357,9 @@ def validate_kms_key_id(kms_key: str, bucket: FakeBucket):
     :raise
     :return:
     """
-    try:
+    # check the ARN format upfront (`arn:partition:service:region:account:resource`) instead of relying on
+    # `parse_arn` raising for plain KeyIds, which are the most common case
+    if kms_key.startswith("arn:") and kms_key.count(":") >= 5:
         parsed_arn = parse_arn(kms_key)
         key_region = parsed_arn["region"]
         # the KMS key should be in the same region as the bucket, we can raise an exception without calling KMS
@@ -239,8 +368,8 @@ def validate_kms_key_id(kms_key: str, bucket: FakeBucket):
                 code="KMS.NotFoundException", message=f"Invalid arn {key_region}"
             )
 
-    except InvalidArnException:
-        # if it fails, the passed ID is a UUID with no region data
+    else:
+        # the passed ID is a UUID with no region data
         key_id = kms_key
         # recreate the ARN manually with the bucket region and bucket owner
         # if the KMS key is cross-account, user should provide an ARN and not a KeyId
@@ -9,10 +9,14 @@ import uuid
 import zlib
 from typing import Dict, List, Union
 
-from botocore.httpchecksum import CrtCrc32cChecksum
-
 from localstack.config import DEFAULT_ENCODING
 
+try:
+    # awscrt is only a runtime dependency, it is not installed with the CLI
+    from awscrt import checksums as crt_checksums
+except ImportError:
+    crt_checksums = None
+
 _unprintables = (
     range(0x00, 0x09),
     range(0x0A, 0x0A),
@@ -153,9 +157,9 @@ def checksum_crc32(string: Union[str, bytes]) -> str:
 
 
 def checksum_crc32c(string: Union[str, bytes]):
-    checksum = CrtCrc32cChecksum()
-    checksum.update(to_bytes(string))
-    return base64.b64encode(checksum.digest()).decode()
+    # awscrt uses the hardware CRC32C instructions (SSE4.2 / ARMv8 CRC) when available
+    checksum = crt_checksums.crc32c(to_bytes(string))
+    return base64.b64encode(checksum.to_bytes(4, "big")).decode()
 
 
 def hash_sha1(string: Union[str, bytes]) -> str:
@@ -4,6 +4,7 @@ import zoneinfo
 from urllib.parse import urlparse
 
 import pytest
+from moto.s3.models import FakeDeleteMarker, FakeKey
 from requests.models import Response
 
 from localstack.aws.api import RequestContext
@@ -524,6 +525,7 @@ class TestS3UtilsAsf:
             ),  # 64 len hex string
             ("f945fc46e86d3af9b2ebf8bda159f94b8f6be81413a5a2e21e8fd3a059de55a9", True),
             ("73E7AFD3413526244BDA3D3E08CF191115773EFF5D875B4860963A71AB7C13E6", True),
+            ("0000000000000000000000000000000000000000000000000000000000000000", True),
             ("0f84b30102b8e116121884e982fedc9d76715877fc810605f7ba5dca143b3bb", False),
             ("0f84b30102b8e116121884e982fedc9d76715877fc810605f7ba5dca143b3bb00", False),
             ("0f84b30102b8e116121884e982fedc9d76715877fc810605f7ba5dca143b3bbz", False),
@@ -597,6 +599,17 @@ class TestS3UtilsAsf:
                 b"test data..",
                 {"ChecksumSHA1": "B++3uSfJMSHWToQMQ1g6lIJY5Eo=", "ChecksumCRC32C": "test"},
             ),
+            # data can also be passed as an iterable of chunks
+            (
+                "SHA256",
+                [b"test ", b"data.."],
+                {"ChecksumSHA256": "2l26x0trnT0r2AvakoFk2MB7eKVKzYESLMxSAKAzoik="},
+            ),
+            ("CRC32", iter([b"test ", b"data.."]), {"ChecksumCRC32": "cZWHwQ=="}),
+            ("CRC32C", [b"test ", b"data.."], {"ChecksumCRC32C": "Pf4upw=="}),
+            ("SHA1", [b"test ", b"data.."], {"ChecksumSHA1": "B++3uSfJMSHWToQMQ1g6lIJY5Eo="}),
+            # bytes-like objects are hashed as a whole
+            ("CRC32", bytearray(b"test data.."), {"ChecksumCRC32": "cZWHwQ=="}),
         ]
 
         for checksum_algorithm, data, request in valid_checksums:
@@ -622,6 +635,54 @@ class TestS3UtilsAsf:
             with pytest.raises(Exception):
                 s3_utils_asf.verify_checksum(checksum_algorithm, data, request)
 
+    def test_is_key_expired(self):
+        offset = datetime.timedelta(seconds=5)
+        assert not s3_utils_asf.is_key_expired(None)
+
+        key = FakeKey("test-key", b"test data..")
+        assert not s3_utils_asf.is_key_expired(key)
+        assert not s3_utils_asf.is_key_expired(FakeDeleteMarker(key))
+
+        # aware expiry dates
+        key.set_expiry(datetime.datetime.now(tz=zoneinfo.ZoneInfo("EST")) - offset)
+        assert s3_utils_asf.is_key_expired(key)
+        key.set_expiry(datetime.datetime.now(tz=zoneinfo.ZoneInfo("EST")) + offset)
+        assert not s3_utils_asf.is_key_expired(key)
+
+        # naive expiry dates are in local time
+        key.set_expiry(datetime.datetime.now() - offset)
+        assert s3_utils_asf.is_key_expired(key)
+        key.set_expiry(datetime.datetime.now() + offset)
+        assert not s3_utils_asf.is_key_expired(key)
+
+        # moto updates the expiry directly when restoring the object
+        key.set_expiry(datetime.datetime.now() - offset)
+        assert s3_utils_asf.is_key_expired(key)
+        key.restore(1)
+        assert not s3_utils_asf.is_key_expired(key)
+
+    def test_is_key_expired_with_now(self):
+        offset = datetime.timedelta(minutes=5)
+        key = FakeKey("test-key", b"test data..")
+        assert not s3_utils_asf.is_key_expired(key, now=datetime.datetime.now())
+
+        # aware expiry date, compared with aware and naive (local time) current times
+        expiry = datetime.datetime.now(tz=zoneinfo.ZoneInfo("EST"))
+        key.set_expiry(expiry)
+        for now in (
+            expiry.astimezone(datetime.timezone.utc),
+            expiry.astimezone().replace(tzinfo=None),
+        ):
+            assert not s3_utils_asf.is_key_expired(key, now=now - offset)
+            assert s3_utils_asf.is_key_expired(key, now=now + offset)
+
+        # naive expiry date (local time), compared with aware and naive current times
+        expiry = datetime.datetime.now()
+        key.set_expiry(expiry)
+        for now in (expiry.astimezone(zoneinfo.ZoneInfo("EST")), expiry):
+            assert not s3_utils_asf.is_key_expired(key, now=now - offset)
+            assert s3_utils_asf.is_key_expired(key, now=now + offset)
+
 
 class TestS3PresignedUrlAsf:
     """